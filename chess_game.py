@@ -2,10 +2,13 @@
 
 import sys
 import os
+import argparse
+import textwrap
 import random
-from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+import time
+from operator import itemgetter
+from enum import IntEnum
+from typing import Dict, Iterator, List, Tuple, Optional
 from colorama import init, Fore, Back, Style
 
 # Initialize colorama for cross-platform colored output
@@ -20,631 +23,1049 @@ def move_cursor_to_top():
     """Move cursor to top-left of terminal."""
     print("\033[H", end="")
 
-class PieceColor(Enum):
-    WHITE = "white"
-    BLACK = "black"
+class PieceColor(IntEnum):
+    WHITE = 0
+    BLACK = 1
 
-class PieceType(Enum):
-    KING = "K"
-    QUEEN = "Q"
-    ROOK = "R"
-    BISHOP = "B"
-    KNIGHT = "N"
-    PAWN = "P"
+class PieceType(IntEnum):
+    PAWN = 0
+    KNIGHT = 1
+    BISHOP = 2
+    ROOK = 3
+    QUEEN = 4
+    KING = 5
+
+    @property
+    def symbol(self) -> str:
+        return "PNBRQK"[self]
 
     @property
     def value_score(self) -> int:
         """Return the relative value score of each piece type."""
-        VALUES = {
-            PieceType.KING: 0,  # Special case, not used in evaluation
-            PieceType.QUEEN: 9,
-            PieceType.ROOK: 5,
-            PieceType.BISHOP: 3,
-            PieceType.KNIGHT: 3,
-            PieceType.PAWN: 1
-        }
-        return VALUES[self]
-
-@dataclass
-class Position:
-    row: int
-    col: int
-
-    def is_valid(self) -> bool:
-        return 0 <= self.row < 8 and 0 <= self.col < 8
-
-    def to_algebraic(self) -> str:
-        return f"{chr(self.col + 97)}{8 - self.row}"
-
-    @staticmethod
-    def from_algebraic(notation: str) -> 'Position':
-        col = ord(notation[0].lower()) - 97
-        row = 8 - int(notation[1])
-        return Position(row, col)
+        return PIECE_VALUES[self]
 
-class Piece:
-    def __init__(self, piece_type: PieceType, color: PieceColor, position: Position):
-        self.piece_type = piece_type
-        self.color = color
-        self.position = position
-        self.has_moved = False
+class GameStatus(IntEnum):
+    ONGOING = 0
+    CHECKMATE = 1
+    STALEMATE = 2
 
-    def __str__(self) -> str:
-        symbol = self.piece_type.value
-        return f"{Fore.BLUE if self.color == PieceColor.WHITE else Fore.RED}{symbol}{Style.RESET_ALL}"
+# Relative value of each piece type, indexed by PieceType
+PIECE_VALUES = (
+    1,  # PAWN
+    3,  # KNIGHT
+    3,  # BISHOP
+    5,  # ROOK
+    9,  # QUEEN
+    0,  # KING, special case, not used in evaluation
+)
 
-    def get_valid_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        row, col = self.position.row, self.position.col
+# Module-level aliases keep enum attribute lookups off the hot paths
+WHITE, BLACK = PieceColor.WHITE, PieceColor.BLACK
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = PieceType
+
+# Squares are ints 0-63 indexed as row * 8 + col, so 0 is a8 and 63 is h1.
+# Use sq >> 3 and sq & 7 to recover the row and column.
+# Names are interned so each square has a single shared name string.
+SQUARE_NAMES = tuple(sys.intern(f"{chr(col + 97)}{8 - row}") for row in range(8) for col in range(8))
+SQUARE_FROM_NAME = {name: sq for sq, name in enumerate(SQUARE_NAMES)}
+
+def parse_move(move: str) -> Tuple[int, int]:
+    """Parse a move like 'e2 e4' into (from_sq, to_sq) via the square name table."""
+    try:
+        from_name, to_name = move.split()
+        return SQUARE_FROM_NAME[from_name], SQUARE_FROM_NAME[to_name]
+    except (ValueError, KeyError):
+        raise ValueError(f"Invalid move format: {move!r}") from None
+
+# Bitboards are 64-bit ints with one bit per square index.
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+RANK_4 = 0xFF << 32
+RANK_5 = 0xFF << 24
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+
+def bits_to_squares(bb: int) -> List[int]:
+    """Convert a bitboard into a list of squares, one per set bit."""
+    squares = []
+    while bb:
+        lsb = bb & -bb
+        squares.append(lsb.bit_length() - 1)
+        bb ^= lsb
+    return squares
+
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((-1, 1), (-1, -1), (1, 1), (1, -1))
+
+def _compile_slider_kernels(name: str, directions: Tuple[Tuple[int, int], ...]) -> tuple:
+    """Generate one attack function per square for a sliding piece.
+
+    With the square fixed, every ray is known up front, so each function is an
+    unrolled if/elif chain per ray that stops at the first occupied square and
+    ORs in the precomputed mask up to and including it. The returned tuple is
+    indexed by square and each entry maps an occupancy bitboard to attacks.
+    """
+    kernels = []
+    for sq in range(64):
+        lines = [f"def {name}_{sq}(occupied):", "    attacks = 0"]
+        for d_row, d_col in directions:
+            ray = []
+            row, col = (sq >> 3) + d_row, (sq & 7) + d_col
+            while 0 <= row < 8 and 0 <= col < 8:
+                ray.append(1 << (row * 8 + col))
+                row += d_row
+                col += d_col
+            mask = 0
+            for i, bit in enumerate(ray[:-1]):
+                mask |= bit
+                lines.append(f"    {'elif' if i else 'if'} occupied & {bit:#x}:")
+                lines.append(f"        attacks |= {mask:#x}")
+            if len(ray) > 1:
+                # The last square on a ray is attacked whether or not it is occupied
+                lines.append("    else:")
+                lines.append(f"        attacks |= {mask | ray[-1]:#x}")
+            elif ray:
+                lines.append(f"    attacks |= {ray[0]:#x}")
+        lines.append("    return attacks")
+        namespace = {}
+        exec(compile("\n".join(lines), f"<{name} kernels>", "exec"), namespace)
+        kernels.append(namespace[f"{name}_{sq}"])
+    return tuple(kernels)
+
+# Squares attacked by a slider, including the first blocker on each ray:
+# ROOK_KERNELS[sq](occupied) and BISHOP_KERNELS[sq](occupied).
+ROOK_KERNELS = _compile_slider_kernels("rook", ROOK_DIRECTIONS)
+BISHOP_KERNELS = _compile_slider_kernels("bishop", BISHOP_DIRECTIONS)
+
+def _build_slider_tables(kernels: tuple, directions: Tuple[Tuple[int, int], ...]) -> Tuple[tuple, tuple]:
+    """Precompute slider attacks for every relevant blocker set on every square.
+
+    The relevant mask for a square is its rays without the board edge, since
+    a piece on the last square of a ray never changes the attacks. Each table
+    maps a masked occupancy to the attack bitboard, so a lookup is
+    tables[sq][occupied & masks[sq]]. Python's int hashing takes the place of
+    magic multipliers.
+    """
+    masks = []
+    tables = []
+    for sq in range(64):
+        mask = 0
+        for d_row, d_col in directions:
+            row, col = (sq >> 3) + d_row, (sq & 7) + d_col
+            while 0 <= row + d_row < 8 and 0 <= col + d_col < 8:
+                mask |= 1 << (row * 8 + col)
+                row += d_row
+                col += d_col
+
+        # Enumerate every subset of the mask with the Carry-Rippler trick
+        kernel = kernels[sq]
+        table = {}
+        subset = 0
+        while True:
+            table[subset] = kernel(subset)
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+        masks.append(mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+ROOK_MASKS, ROOK_TABLES = _build_slider_tables(ROOK_KERNELS, ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_TABLES = _build_slider_tables(BISHOP_KERNELS, BISHOP_DIRECTIONS)
+
+KNIGHT_OFFSETS = (
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+)
+KING_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+)
+
+def _build_attack_table(offsets: Tuple[Tuple[int, int], ...]) -> Tuple[int, ...]:
+    """Build a 64-entry table of the squares reachable from each square by the given offsets."""
+    table = []
+    for sq in range(64):
+        row, col = sq >> 3, sq & 7
+        attacks = 0
+        for dr, dc in offsets:
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < 8 and 0 <= new_col < 8:
+                attacks |= 1 << (new_row * 8 + new_col)
+        table.append(attacks)
+    return tuple(table)
+
+# Attack tables indexed by square, built once at import
+KNIGHT_ATTACKS = _build_attack_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_attack_table(KING_OFFSETS)
+PAWN_ATTACKS_WHITE = _build_attack_table(((-1, -1), (-1, 1)))
+PAWN_ATTACKS_BLACK = _build_attack_table(((1, -1), (1, 1)))
+
+def _build_between_table() -> Tuple[Tuple[int, ...], ...]:
+    """BETWEEN[a][b] is the squares strictly between a and b on a shared line, else 0."""
+    table = [[0] * 64 for _ in range(64)]
+    for sq in range(64):
+        for d_row, d_col in ROOK_DIRECTIONS + BISHOP_DIRECTIONS:
+            between = 0
+            row, col = (sq >> 3) + d_row, (sq & 7) + d_col
+            while 0 <= row < 8 and 0 <= col < 8:
+                table[sq][row * 8 + col] = between
+                between |= 1 << (row * 8 + col)
+                row += d_row
+                col += d_col
+    return tuple(tuple(row) for row in table)
+
+BETWEEN = _build_between_table()
+
+# Zobrist keys indexed by [Piece.bb_index][square]; a fixed seed keeps hashes stable between runs
+_zobrist_rng = random.Random(0xC0FFEE)
+ZOBRIST_KEYS = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in range(64)) for _ in range(12))
+# Search keys also fold in the side to move and the en passant file
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+ZOBRIST_EP_FILE = tuple(_zobrist_rng.getrandbits(64) for _ in range(8))
+
+# Number of slots in the per-board move generation and check caches (a power of two)
+MOVE_CACHE_SIZE = 1 << 16
+
+# Number of slots in the search transposition table (a power of two), paired
+# into buckets of a depth-preferred slot and an always-replace slot
+TT_SIZE = 1 << 18
+
+# Deepest ply from the root that keeps killer moves
+MAX_PLY = 64
+
+# Extra depth taken off the search after a null move
+NULL_MOVE_REDUCTION = 2
+
+# Half-width of the root window around the previous iteration's score, in pawns
+ASPIRATION_WINDOW = 0.5
+
+# Transposition table bound types
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Piece values for ordering captures, indexed by PieceType; taking the king ranks first
+CAPTURE_VALUES = PIECE_VALUES[:KING] + (100,)
+
+# Most a move at depth 1 is assumed to gain beyond the material it captures,
+# in pawns; moves that cannot lift the score to alpha even so are skipped
+FUTILITY_MARGIN = 2.0
+
+# Same idea in quiescence: captures that cannot lift the stand-pat score to
+# alpha even with this much to spare, in pawns, are skipped (delta pruning)
+DELTA_MARGIN = 2.0
+
+# Colored piece letters indexed by Piece.bb_index
+PIECE_GLYPHS = tuple(
+    f"{Fore.BLUE if color == WHITE else Fore.RED}{piece_type.symbol}{Style.RESET_ALL}"
+    for piece_type in PieceType for color in PieceColor
+)
+
+# Colored text for every square, indexed [square shade][Piece.bb_index], with
+# index 12 for an empty square. Shade 0 is a light square.
+SQUARE_GLYPHS = tuple(
+    tuple(f"{bg}{glyph}{Style.RESET_ALL} " for glyph in PIECE_GLYPHS) + (f"{bg} {Style.RESET_ALL} ",)
+    for bg in (Back.WHITE, Back.BLACK)
+)
+
+# Mailbox squares hold a piece code: 0 for empty, otherwise
+# 1 | color << 1 | piece_type << 2, plus MOVED once the piece has moved.
+# (code >> 1) & 15 is the piece's bb_index, so it indexes bb and ZOBRIST_KEYS.
+MOVED = 0x20
+
+# PieceType members indexed by the type bits of a code, cheaper than PieceType(n)
+PIECE_TYPES = tuple(PieceType)
+
+def piece_code(piece_type: PieceType, color: PieceColor) -> int:
+    return 1 | (color << 1) | (piece_type << 2)
+
+def _pawn_moves(board: 'Board', sq: int, color: int) -> int:
+    bit = 1 << sq
+    occ_by_color = board.occ_by_color
+    enemy = occ_by_color[color ^ 1]
+    empty = FULL_BOARD ^ board.occ
+
+    # Pushes and diagonal captures depend on color
+    if color == WHITE:
+        single = (bit >> 8) & empty
+        moves = single | ((single >> 8) & empty & RANK_4)
+        attacks = PAWN_ATTACKS_WHITE[sq]
+    else:
+        single = (bit << 8) & empty
+        moves = single | ((single << 8) & empty & RANK_5)
+        attacks = PAWN_ATTACKS_BLACK[sq]
+    moves |= attacks & enemy
+
+    # En passant capture onto the square skipped by a double move
+    ep_sq = board.en_passant_sq
+    if ep_sq is not None and (attacks >> ep_sq) & 1:
+        # Only an opponent's double move counts: it lands just beyond ep_sq
+        # and leaves ep_sq on the third rank from the opponent's side
+        if color == WHITE:
+            if ep_sq >> 3 == 2 and (enemy >> (ep_sq + 8)) & 1:
+                moves |= 1 << ep_sq
+        elif ep_sq >> 3 == 5 and (enemy >> (ep_sq - 8)) & 1:
+            moves |= 1 << ep_sq
+
+    return moves
+
+def _pawn_move_sets(board: 'Board', color: int) -> List[Tuple[int, int]]:
+    """Generate every pawn move of color at once as (targets, delta) pairs.
+
+    Each set bit to_sq in targets is a move from to_sq + delta, so pushes and
+    captures for all pawns come from a few shifts instead of one call per pawn.
+    """
+    pawns = board.bb[PAWN * 2 + color]
+    enemy = board.occ_by_color[color ^ 1]
+    empty = FULL_BOARD ^ board.occ
+    if color == WHITE:
+        single = (pawns >> 8) & empty
+        sets = [(single, 8), ((single >> 8) & empty & RANK_4, 16),
+                (((pawns & ~FILE_A) >> 9) & enemy, 9), (((pawns & ~FILE_H) >> 7) & enemy, 7)]
+    else:
+        single = (pawns << 8) & empty
+        sets = [(single, -8), ((single << 8) & empty & RANK_5, -16),
+                (((pawns & ~FILE_A) << 7) & enemy, -7), (((pawns & ~FILE_H) << 9) & enemy, -9)]
+
+    # En passant, with the same opponent double move checks as _pawn_moves
+    ep_sq = board.en_passant_sq
+    if ep_sq is not None:
+        if color == WHITE:
+            capturers = PAWN_ATTACKS_BLACK[ep_sq] & pawns if ep_sq >> 3 == 2 and (enemy >> (ep_sq + 8)) & 1 else 0
+        else:
+            capturers = PAWN_ATTACKS_WHITE[ep_sq] & pawns if ep_sq >> 3 == 5 and (enemy >> (ep_sq - 8)) & 1 else 0
+        for from_sq in bits_to_squares(capturers):
+            sets.append((1 << ep_sq, from_sq - ep_sq))
+    return sets
+
+def _rook_moves(board: 'Board', sq: int, color: int) -> int:
+    return ROOK_TABLES[sq][board.occ & ROOK_MASKS[sq]] & ~board.occ_by_color[color]
+
+def _knight_moves(board: 'Board', sq: int, color: int) -> int:
+    return KNIGHT_ATTACKS[sq] & ~board.occ_by_color[color]
+
+def _bishop_moves(board: 'Board', sq: int, color: int) -> int:
+    return BISHOP_TABLES[sq][board.occ & BISHOP_MASKS[sq]] & ~board.occ_by_color[color]
+
+def _queen_moves(board: 'Board', sq: int, color: int) -> int:
+    occ = board.occ
+    return ((ROOK_TABLES[sq][occ & ROOK_MASKS[sq]] | BISHOP_TABLES[sq][occ & BISHOP_MASKS[sq]])
+            & ~board.occ_by_color[color])
+
+def _king_moves(board: 'Board', sq: int, color: int) -> int:
+    # TODO: Add castling moves later
+    return KING_ATTACKS[sq] & ~board.occ_by_color[color]
+
+# Move generators indexed by PieceType; each returns a bitboard of target squares
+MOVE_FNS = (
+    _pawn_moves, _knight_moves, _bishop_moves,
+    _rook_moves, _queen_moves, _king_moves
+)
+
+def _get_position_bonus(piece_type: PieceType, color: PieceColor, row: int, col: int) -> float:
+    """Calculate position bonus based on piece type and position."""
+    bonus = 0.0
+    
+    # Pawns are more valuable as they advance
+    if piece_type == PAWN:
+        if color == WHITE:
+            bonus = (7 - row) * 0.1  # Bonus for advancing
+        else:
+            bonus = row * 0.1
+    
+    # Control of center squares
+    if 2 <= row <= 5 and 2 <= col <= 5:
+        bonus += 0.2
         
-        if self.piece_type == PieceType.PAWN:
-            # Direction depends on color
-            direction = 1 if self.color == PieceColor.BLACK else -1
-            
-            # Forward move
-            forward = Position(row + direction, col)
-            if (0 <= forward.row < 8 and 
-                not board.squares[forward.row][forward.col]):  # Empty square
-                moves.append(forward)
-                
-                # Initial two-square move
-                if not self.has_moved:
-                    double_forward = Position(row + 2 * direction, col)
-                    if (0 <= double_forward.row < 8 and 
-                        not board.squares[double_forward.row][double_forward.col]):
-                        moves.append(double_forward)
-            
-            # Diagonal captures
-            for capture_col in [col - 1, col + 1]:
-                if 0 <= capture_col < 8:
-                    capture_pos = Position(row + direction, capture_col)
-                    if 0 <= capture_pos.row < 8:
-                        # Normal capture
-                        target = board.squares[capture_pos.row][capture_pos.col]
-                        if target and target.color != self.color:
-                            moves.append(capture_pos)
-                        
-                        # En passant capture
-                        if board.last_pawn_move:
-                            last_from, last_to = board.last_pawn_move
-                            if (last_to.col == capture_col and  # Adjacent column
-                                last_to.row == row and  # Same row
-                                abs(last_from.row - last_to.row) == 2 and  # Double move
-                                board.squares[last_to.row][last_to.col].color != self.color):  # Opponent's pawn
-                                moves.append(capture_pos)
-            
-            # TODO: Add en passant captures later
-            
-        elif self.piece_type == PieceType.KNIGHT:
-            # Knight moves in L-shape
-            knight_moves = [
-                (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                (1, -2), (1, 2), (2, -1), (2, 1)
-            ]
-            for dr, dc in knight_moves:
-                new_row, new_col = row + dr, col + dc
-                if 0 <= new_row < 8 and 0 <= new_col < 8:
-                    target_piece = board.squares[new_row][new_col]
-                    if not target_piece or target_piece.color != self.color:
-                        moves.append(Position(new_row, new_col))
-                        
-        elif self.piece_type == PieceType.BISHOP:
-            # Bishop moves diagonally
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                while 0 <= new_row < 8 and 0 <= new_col < 8:
-                    target_piece = board.squares[new_row][new_col]
-                    if not target_piece:
-                        moves.append(Position(new_row, new_col))
-                    elif target_piece.color != self.color:
-                        moves.append(Position(new_row, new_col))
-                        break
-                    else:
-                        break
-                    new_row, new_col = new_row + dr, new_col + dc
-                    
-        elif self.piece_type == PieceType.ROOK:
-            # Rook moves horizontally and vertically
-            directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                while 0 <= new_row < 8 and 0 <= new_col < 8:
-                    target_piece = board.squares[new_row][new_col]
-                    if not target_piece:
-                        moves.append(Position(new_row, new_col))
-                    elif target_piece.color != self.color:
-                        moves.append(Position(new_row, new_col))
-                        break
-                    else:
-                        break
-                    new_row, new_col = new_row + dr, new_col + dc
-                    
-        elif self.piece_type == PieceType.QUEEN:
-            # Queen moves like both bishop and rook
-            directions = [
-                (-1, -1), (-1, 0), (-1, 1),
-                (0, -1),           (0, 1),
-                (1, -1),  (1, 0),  (1, 1)
-            ]
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                while 0 <= new_row < 8 and 0 <= new_col < 8:
-                    target_piece = board.squares[new_row][new_col]
-                    if not target_piece:
-                        moves.append(Position(new_row, new_col))
-                    elif target_piece.color != self.color:
-                        moves.append(Position(new_row, new_col))
-                        break
-                    else:
-                        break
-                    new_row, new_col = new_row + dr, new_col + dc
-                    
-        elif self.piece_type == PieceType.KING:
-            # King moves one square in any direction
-            directions = [
-                (-1, -1), (-1, 0), (-1, 1),
-                (0, -1),           (0, 1),
-                (1, -1),  (1, 0),  (1, 1)
-            ]
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                if 0 <= new_row < 8 and 0 <= new_col < 8:
-                    target_piece = board.squares[new_row][new_col]
-                    if not target_piece or target_piece.color != self.color:
-                        moves.append(Position(new_row, new_col))
-            
-            # TODO: Add castling moves later
+    # Knights are better near the center
+    if piece_type == KNIGHT:
+        distance_from_center = abs(3.5 - row) + abs(3.5 - col)
+        bonus += (8 - distance_from_center) * 0.1
         
-        return moves
+    return bonus
 
-    def _get_pawn_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        direction = 1 if self.color == PieceColor.BLACK else -1
-        
-        # Forward move
-        forward = Position(self.position.row + direction, self.position.col)
-        if forward.is_valid() and not board.get_piece(forward):
-            moves.append(forward)
-            
-            # Initial two-square move
-            if not self.has_moved:
-                double_forward = Position(self.position.row + 2 * direction, self.position.col)
-                if double_forward.is_valid() and not board.get_piece(double_forward):
-                    moves.append(double_forward)
-
-        # Capture moves
-        for col_offset in [-1, 1]:
-            capture_pos = Position(self.position.row + direction, self.position.col + col_offset)
-            if capture_pos.is_valid():
-                piece = board.get_piece(capture_pos)
-                if piece and piece.color != self.color:
-                    moves.append(capture_pos)
+# Material plus position bonus for each piece on each square in centipawns,
+# indexed [Piece.bb_index][square] and signed from white's perspective. Ints
+# keep the incrementally updated Board.eval_cp exact.
+PIECE_SQUARE_VALUES = tuple(
+    tuple(
+        round((1 if color == WHITE else -1) * 100
+              * (piece_type.value_score + _get_position_bonus(piece_type, color, sq >> 3, sq & 7)))
+        for sq in range(64)
+    )
+    for piece_type in PieceType for color in PieceColor
+)
 
-        return moves
+# Fixed lines above and below the board in display()
+BOARD_HEADER = "\n   a b c d e f g h\n   ---------------\n"
+BOARD_FOOTER = "   ---------------\n   a b c d e f g h\n"
 
-    def _get_rook_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        
-        for dx, dy in directions:
-            for i in range(1, 8):
-                new_pos = Position(self.position.row + dx * i, self.position.col + dy * i)
-                if not new_pos.is_valid():
-                    break
-                    
-                piece = board.get_piece(new_pos)
-                if piece:
-                    if piece.color != self.color:
-                        moves.append(new_pos)
-                    break
-                moves.append(new_pos)
-                
-        return moves
+# Whole display frame, including the screen clear, with one {} slot per square
+FRAME_TEMPLATE = "\033[2J\033[H" + BOARD_HEADER + "".join(
+    f"{8 - row} | " + "{}" * 8 + f"| {8 - row}\n" for row in range(8)
+) + BOARD_FOOTER
 
-    def _get_knight_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        offsets = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        
-        for dx, dy in offsets:
-            new_pos = Position(self.position.row + dx, self.position.col + dy)
-            if new_pos.is_valid():
-                piece = board.get_piece(new_pos)
-                if not piece or piece.color != self.color:
-                    moves.append(new_pos)
-                    
-        return moves
+# SQUARE_GLYPHS row for each square's shade, indexed by square
+CELL_GLYPHS = tuple(SQUARE_GLYPHS[((sq >> 3) + sq) & 1] for sq in range(64))
 
-    def _get_bishop_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        
-        for dx, dy in directions:
-            for i in range(1, 8):
-                new_pos = Position(self.position.row + dx * i, self.position.col + dy * i)
-                if not new_pos.is_valid():
-                    break
-                    
-                piece = board.get_piece(new_pos)
-                if piece:
-                    if piece.color != self.color:
-                        moves.append(new_pos)
-                    break
-                moves.append(new_pos)
-                
-        return moves
+class Piece:
+    """Read-only view of the piece code on one square, as returned by Board.get_piece."""
+    __slots__ = ('piece_type', 'color', 'square', 'has_moved', 'bb_index')
 
-    def _get_queen_moves(self, board: 'Board') -> List[Position]:
-        return self._get_rook_moves(board) + self._get_bishop_moves(board)
+    def __init__(self, code: int, square: int):
+        self.piece_type = PIECE_TYPES[(code >> 2) & 7]
+        self.color = PieceColor((code >> 1) & 1)
+        self.square = square
+        self.has_moved = bool(code & MOVED)
+        self.bb_index = (code >> 1) & 15
 
-    def _get_king_moves(self, board: 'Board') -> List[Position]:
-        moves = []
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1), (0, 1),
-            (1, -1), (1, 0), (1, 1)
-        ]
-        
-        for dx, dy in directions:
-            new_pos = Position(self.position.row + dx, self.position.col + dy)
-            if new_pos.is_valid():
-                piece = board.get_piece(new_pos)
-                if not piece or piece.color != self.color:
-                    moves.append(new_pos)
-                    
-        return moves
+    def __str__(self) -> str:
+        return PIECE_GLYPHS[self.bb_index]
+
+    def attacks(self, board: 'Board') -> int:
+        """Return a bitboard of the squares this piece can move to."""
+        return MOVE_FNS[self.piece_type](board, self.square, self.color)
+
+    def get_valid_moves(self, board: 'Board') -> List[int]:
+        return bits_to_squares(self.attacks(board))
 
 class Board:
     def __init__(self):
-        self.squares = [[None for _ in range(8)] for _ in range(8)]
+        # Attack tables, slider kernels, Zobrist keys and glyphs are module
+        # globals built once at import; constructing a Board only allocates state.
+        self.mailbox = bytearray(64)  # Piece code on each square, see piece_code
+        self.bb = [0] * 12  # One bitboard per piece type and color, see Piece.bb_index
+        self.occ_by_color = [0, 0]  # Occupancy indexed by PieceColor
+        self.occ = 0
+        self.zobrist = 0  # XOR of ZOBRIST_KEYS for every piece on the board
+        self.eval_cp = 0  # Sum of PIECE_SQUARE_VALUES for every piece on the board
+        self._move_cache = [None] * MOVE_CACHE_SIZE
+        self._check_cache = [None] * MOVE_CACHE_SIZE  # (zobrist * 2 + color, in_check)
+        self._tt = [None] * TT_SIZE  # (key, depth, value, bound, best_move)
+        self._killers = [[None, None] for _ in range(MAX_PLY)]  # Two quiet cutoff moves per ply
+        self._history = [[0] * 64 for _ in range(12)]  # Quiet cutoff score by [bb_index][to_sq]
+        self._frame = (None, "")  # (zobrist, text) of the last frame drawn by display()
         self._setup_board()
-        self.last_pawn_move = None  # Tuple of (from_pos, to_pos) for en passant
-        self.move_history = []  # List of tuples (from_pos, to_pos, piece_type, color)
-        self.current_player = PieceColor.WHITE
+        self.en_passant_sq = None  # Square skipped by the last pawn double move
+        self.move_history = []  # List of tuples (from_sq, to_sq, piece_type, color)
+        self.current_player = WHITE
 
     def _setup_board(self):
         # Setup white pieces
-        self._place_piece(PieceType.ROOK, PieceColor.WHITE, Position(7, 0))
-        self._place_piece(PieceType.KNIGHT, PieceColor.WHITE, Position(7, 1))
-        self._place_piece(PieceType.BISHOP, PieceColor.WHITE, Position(7, 2))
-        self._place_piece(PieceType.QUEEN, PieceColor.WHITE, Position(7, 3))
-        self._place_piece(PieceType.KING, PieceColor.WHITE, Position(7, 4))
-        self._place_piece(PieceType.BISHOP, PieceColor.WHITE, Position(7, 5))
-        self._place_piece(PieceType.KNIGHT, PieceColor.WHITE, Position(7, 6))
-        self._place_piece(PieceType.ROOK, PieceColor.WHITE, Position(7, 7))
+        self._place_piece(ROOK, WHITE, 56)
+        self._place_piece(KNIGHT, WHITE, 57)
+        self._place_piece(BISHOP, WHITE, 58)
+        self._place_piece(QUEEN, WHITE, 59)
+        self._place_piece(KING, WHITE, 60)
+        self._place_piece(BISHOP, WHITE, 61)
+        self._place_piece(KNIGHT, WHITE, 62)
+        self._place_piece(ROOK, WHITE, 63)
 
         # Setup black pieces
-        self._place_piece(PieceType.ROOK, PieceColor.BLACK, Position(0, 0))
-        self._place_piece(PieceType.KNIGHT, PieceColor.BLACK, Position(0, 1))
-        self._place_piece(PieceType.BISHOP, PieceColor.BLACK, Position(0, 2))
-        self._place_piece(PieceType.QUEEN, PieceColor.BLACK, Position(0, 3))
-        self._place_piece(PieceType.KING, PieceColor.BLACK, Position(0, 4))
-        self._place_piece(PieceType.BISHOP, PieceColor.BLACK, Position(0, 5))
-        self._place_piece(PieceType.KNIGHT, PieceColor.BLACK, Position(0, 6))
-        self._place_piece(PieceType.ROOK, PieceColor.BLACK, Position(0, 7))
+        self._place_piece(ROOK, BLACK, 0)
+        self._place_piece(KNIGHT, BLACK, 1)
+        self._place_piece(BISHOP, BLACK, 2)
+        self._place_piece(QUEEN, BLACK, 3)
+        self._place_piece(KING, BLACK, 4)
+        self._place_piece(BISHOP, BLACK, 5)
+        self._place_piece(KNIGHT, BLACK, 6)
+        self._place_piece(ROOK, BLACK, 7)
 
         # Setup pawns
         for col in range(8):
-            self._place_piece(PieceType.PAWN, PieceColor.BLACK, Position(1, col))
-            self._place_piece(PieceType.PAWN, PieceColor.WHITE, Position(6, col))
+            self._place_piece(PAWN, BLACK, 8 + col)
+            self._place_piece(PAWN, WHITE, 48 + col)
+
+    def _place_piece(self, piece_type: PieceType, color: PieceColor, sq: int):
+        code = piece_code(piece_type, color)
+        self.mailbox[sq] = code
+        self._toggle_bit(code, sq)
 
-    def _place_piece(self, piece_type: PieceType, color: PieceColor, position: Position):
-        self.squares[position.row][position.col] = Piece(piece_type, color, position)
+    def _toggle_bit(self, code: int, sq: int):
+        """Flip the bit for the piece code on sq in its bitboard and the occupancy masks."""
+        bit = 1 << sq
+        bb_index = (code >> 1) & 15
+        if self.bb[bb_index] & bit:
+            self.eval_cp -= PIECE_SQUARE_VALUES[bb_index][sq]
+        else:
+            self.eval_cp += PIECE_SQUARE_VALUES[bb_index][sq]
+        self.bb[bb_index] ^= bit
+        self.zobrist ^= ZOBRIST_KEYS[bb_index][sq]
+        self.occ_by_color[bb_index & 1] ^= bit
+        self.occ ^= bit
 
-    def get_piece(self, position: Position) -> Optional[Piece]:
-        if position.is_valid():
-            return self.squares[position.row][position.col]
+    def make_move(self, from_sq: int, to_sq: int) -> Tuple[int, int, int, int, Optional[int]]:
+        """Play a move in place without validation and return the undo info.
+
+        Handles en passant captures and the en passant square, so the board
+        is exactly restored by unmake_move(undo).
+        """
+        mailbox = self.mailbox
+        code = mailbox[from_sq]
+        is_pawn = (code >> 2) & 7 == PAWN
+        captured_sq = to_sq
+        captured = mailbox[to_sq]
+        if not captured and is_pawn and (from_sq ^ to_sq) & 7:
+            # En passant, the captured pawn sits beside the from square
+            captured_sq = (from_sq & ~7) | (to_sq & 7)
+            captured = mailbox[captured_sq]
+        if captured:
+            self._toggle_bit(captured, captured_sq)
+            mailbox[captured_sq] = 0
+        self._toggle_bit(code, from_sq)
+        self._toggle_bit(code, to_sq)
+        mailbox[to_sq] = code
+        mailbox[from_sq] = 0
+
+        undo = (from_sq, to_sq, captured, captured_sq, self.en_passant_sq)
+        if is_pawn and abs(from_sq - to_sq) == 16:
+            self.en_passant_sq = (from_sq + to_sq) // 2
+        else:
+            self.en_passant_sq = None
+        return undo
+
+    def unmake_move(self, undo: Tuple[int, int, int, int, Optional[int]]):
+        """Reverse a move made by make_move."""
+        from_sq, to_sq, captured, captured_sq, self.en_passant_sq = undo
+        mailbox = self.mailbox
+        code = mailbox[to_sq]
+        self._toggle_bit(code, to_sq)
+        self._toggle_bit(code, from_sq)
+        mailbox[from_sq] = code
+        mailbox[to_sq] = 0
+        if captured:
+            self._toggle_bit(captured, captured_sq)
+            mailbox[captured_sq] = captured
+
+    def attacks(self, sq: int) -> int:
+        """Return a bitboard of the squares the piece on sq can move to."""
+        code = self.mailbox[sq]
+        return MOVE_FNS[(code >> 2) & 7](self, sq, (code >> 1) & 1)
+
+    def get_piece(self, sq: int) -> Optional[Piece]:
+        if 0 <= sq < 64 and self.mailbox[sq]:
+            return Piece(self.mailbox[sq], sq)
         return None
 
-    def move_piece(self, from_pos: Position, to_pos: Position) -> Tuple[bool, Optional[str]]:
+    def move_piece(self, from_sq: int, to_sq: int) -> Tuple[bool, Optional[str]]:
         """Move a piece and return (success, error_message)."""
-        piece = self.squares[from_pos.row][from_pos.col]
-        if not piece:
+        if not 0 <= from_sq < 64 or not self.mailbox[from_sq]:
             return False, "No piece at starting position"
-            
-        if piece.color != self.current_player:
+        code = self.mailbox[from_sq]
+        piece_type = PIECE_TYPES[(code >> 2) & 7]
+        color = PieceColor((code >> 1) & 1)
+
+        if color != self.current_player:
             return False, "Not your turn"
 
         # Check if move is in piece's valid moves
-        valid_moves = piece.get_valid_moves(self)
-        if to_pos not in valid_moves:
-            piece_type = piece.piece_type.value
-            return False, f"Invalid move for {piece_type} - not in its movement pattern"
-            
-        # Track last pawn move for en passant
-        if piece.piece_type == PieceType.PAWN:
-            self.last_pawn_move = (from_pos, to_pos)
-            
-            # Handle en passant capture
-            if abs(from_pos.col - to_pos.col) == 1 and not self.squares[to_pos.row][to_pos.col]:
-                # Remove captured pawn
-                capture_row = from_pos.row
-                self.squares[capture_row][to_pos.col] = None
-        else:
-            self.last_pawn_move = None
+        if not (self.attacks(from_sq) >> to_sq) & 1:
+            return False, f"Invalid move for {piece_type.symbol} - not in its movement pattern"
             
-        # Try the move
-        captured_piece = self.squares[to_pos.row][to_pos.col]
-        self.squares[to_pos.row][to_pos.col] = piece
-        self.squares[from_pos.row][from_pos.col] = None
+        # Try the move, including any en passant capture
+        undo = self.make_move(from_sq, to_sq)
         
         # Check if move puts own king in check
-        if self.is_king_in_check(piece.color):
-            # Undo the move
-            self.squares[from_pos.row][from_pos.col] = piece
-            self.squares[to_pos.row][to_pos.col] = captured_piece
+        if self.is_king_in_check(color):
+            self.unmake_move(undo)
             return False, "Move would leave your king in check"
 
         # Record move in history
-        self.move_history.append((from_pos, to_pos, piece.piece_type, piece.color))
+        self.move_history.append((from_sq, to_sq, piece_type, color))
         
-        # Update piece's internal position and switch players
-        piece.position = to_pos
-        piece.has_moved = True
-        self.current_player = PieceColor.BLACK if self.current_player == PieceColor.WHITE else PieceColor.WHITE
+        # Update piece state and switch players
+        self.mailbox[to_sq] |= MOVED
+        self.current_player = BLACK if self.current_player == WHITE else WHITE
         return True, None
 
-    def get_all_valid_moves(self, color: PieceColor) -> List[Tuple[Position, Position]]:
-        """Get all valid moves for a given color."""
+    def get_all_valid_moves(self, color: PieceColor) -> List[Tuple[int, int]]:
+        """Get all valid moves for a given color.
+
+        Results are cached by Zobrist hash, so the returned list is shared
+        and must not be modified.
+        """
+        key = (self.zobrist, color, self.en_passant_sq)
+        slot = self.zobrist & (MOVE_CACHE_SIZE - 1)
+        entry = self._move_cache[slot]
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        # Generators, the mailbox and append are bound to locals for the loop
+        mailbox = self.mailbox
+        move_fns = MOVE_FNS
         moves = []
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if piece and piece.color == color:
-                    valid_moves = piece.get_valid_moves(self)
-                    moves.extend([(Position(row, col), move) for move in valid_moves])
+        append = moves.append
+        # Pawns are generated set-wise, the other pieces one square at a time
+        for targets, delta in _pawn_move_sets(self, color):
+            while targets:
+                lsb = targets & -targets
+                to_sq = lsb.bit_length() - 1
+                append((to_sq + delta, to_sq))
+                targets ^= lsb
+        for sq in bits_to_squares(self.occ_by_color[color] & ~self.bb[PAWN * 2 + color]):
+            targets = move_fns[(mailbox[sq] >> 2) & 7](self, sq, color)
+            while targets:
+                lsb = targets & -targets
+                append((sq, lsb.bit_length() - 1))
+                targets ^= lsb
+        self._move_cache[slot] = (key, moves)
         return moves
 
-    def make_computer_move(self, color: PieceColor, depth: int = 3) -> bool:
-        """Make a move for the computer using minimax with alpha-beta pruning."""
-        best_score = float('-inf') if color == PieceColor.WHITE else float('inf')
-        best_move = None
-        
-        valid_moves = self.get_all_valid_moves(color)
+    def position_key(self, color: PieceColor) -> int:
+        """Return the Zobrist key of the position with color to move, as used by the TT."""
+        key = self.zobrist ^ ZOBRIST_SIDE if color else self.zobrist
+        if self.en_passant_sq is not None:
+            key ^= ZOBRIST_EP_FILE[self.en_passant_sq & 7]
+        return key
+
+    def probe_book(self, color: PieceColor) -> Optional[Tuple[int, int]]:
+        """Return the opening book move for color in this position, or None if out of book."""
+        moves = OPENING_BOOK.get(self.position_key(color))
+        return moves[0] if moves else None
+
+    def make_computer_move(self, color: PieceColor, depth: int = 3,
+                           time_limit: Optional[float] = None) -> bool:
+        """Make a move for the computer using iteratively deepened alpha-beta search.
+
+        With a time_limit in seconds, no deeper iteration is started once it has passed.
+        """
+        # Known openings are played straight from the book, a rejected book move falls back to the search
+        book_move = self.probe_book(color)
+        if book_move is not None and self.move_piece(*book_move)[0]:
+            return True
+
+        # Only the root is filtered for legality, the search below it stays pseudo-legal
+        valid_moves = self.get_legal_moves(color)
         if not valid_moves:
             return False
+
+        # Killers from the previous search sit one ply off, start afresh;
+        # history carries over at half weight so recent cutoffs dominate
+        for killers in self._killers:
+            killers[0] = killers[1] = None
+        for scores in self._history:
+            scores[:] = [score >> 1 for score in scores]
+
+        # Search depth 1, 2, ... so each pass seeds the TT and the root order for the next
+        start = time.monotonic()
+        best_score = None
+        for iteration_depth in range(1, depth + 1):
+            if time_limit is not None and iteration_depth > 1 and time.monotonic() - start >= time_limit:
+                break
+            if best_score is None:
+                best_move, scores = self._search_root(color, valid_moves, iteration_depth)
+            else:
+                # Aspiration window around the last score, widened if the result falls outside it.
+                # A failed pass may have stopped early, so only the full-window scores are kept.
+                alpha, beta = best_score - ASPIRATION_WINDOW, best_score + ASPIRATION_WINDOW
+                best_move, scores = self._search_root(color, valid_moves, iteration_depth, alpha, beta)
+                if best_move is None or scores[best_move] >= beta:
+                    best_move, scores = self._search_root(color, valid_moves, iteration_depth)
+            if best_move is not None:
+                best_score = scores[best_move]
+            valid_moves.sort(key=lambda move: scores.get(move, float('-inf')), reverse=True)
+
+        success, _ = self.move_piece(*valid_moves[0])
+        return success
+
+    def _search_root(self, color: PieceColor, moves: List[Tuple[int, int]], depth: int,
+                     alpha: float = float('-inf'), beta: float = float('inf')
+                     ) -> Tuple[Optional[Tuple[int, int]], Dict[Tuple[int, int], float]]:
+        """Search each root move to depth and return the best move and every move's score.
+
+        Scores are from color's perspective. The best move is None if every
+        move scores at or below alpha. On a fail high (a score reaching a finite
+        beta) the search stops, so scores only covers the moves searched so far.
+        """
+        best_move = None
+        scores = {}
             
-        for from_pos, to_pos in valid_moves:
+        for from_sq, to_sq in moves:
             # Try move
-            piece = self.squares[from_pos.row][from_pos.col]
-            captured = self.squares[to_pos.row][to_pos.col]
-            self.squares[to_pos.row][to_pos.col] = piece
-            self.squares[from_pos.row][from_pos.col] = None
+            undo = self.make_move(from_sq, to_sq)
             
             # Evaluate position
-            score = self.minimax(depth - 1, float('-inf'), float('inf'), color != PieceColor.WHITE)
+            score = -self.negamax(depth - 1, -beta, -alpha, color ^ 1, 1)
             
             # Undo move
-            self.squares[from_pos.row][from_pos.col] = piece
-            self.squares[to_pos.row][to_pos.col] = captured
+            self.unmake_move(undo)
+            scores[(from_sq, to_sq)] = score
             
-            # Update best move
-            if color == PieceColor.WHITE and score > best_score:
-                best_score = score
-                best_move = (from_pos, to_pos)
-            elif color == PieceColor.BLACK and score < best_score:
-                best_score = score
-                best_move = (from_pos, to_pos)
-        
-        if best_move:
-            success, _ = self.move_piece(best_move[0], best_move[1])
-            return success
-        return False
+            # Update best move and narrow the window for the remaining moves
+            if score > alpha:
+                alpha = score
+                best_move = (from_sq, to_sq)
+                if beta != float('inf') and alpha >= beta:
+                    # Further moves would be searched with an inverted window
+                    break
+        return best_move, scores
+
+    def _order_moves(self, moves: List[Tuple[int, int]], tt_move: Optional[Tuple[int, int]],
+                     killers: List[Optional[Tuple[int, int]]] = ()) -> List[Tuple[int, int]]:
+        """Order moves for alpha-beta: the TT move, captures by MVV-LVA, killers, then quiet moves.
+
+        Quiet moves are ordered by the history heuristic.
+        """
+        mailbox = self.mailbox
+        history = self._history
+        first = []
+        captures = []
+        killer_moves = []
+        quiet = []
+        for move in moves:
+            if move == tt_move:
+                first.append(move)
+                continue
+            victim = mailbox[move[1]]
+            if victim:
+                attacker = mailbox[move[0]]
+                score = 10 * CAPTURE_VALUES[(victim >> 2) & 7] - CAPTURE_VALUES[(attacker >> 2) & 7]
+                captures.append((score, move))
+            elif move in killers:
+                killer_moves.append(move)
+            else:
+                quiet.append((history[(mailbox[move[0]] >> 1) & 15][move[1]], move))
+        captures.sort(key=itemgetter(0), reverse=True)
+        first.extend([move for _, move in captures])
+        if len(killer_moves) > 1 and killer_moves[0] != killers[0]:
+            killer_moves.reverse()
+        first.extend(killer_moves)
+        quiet.sort(key=itemgetter(0), reverse=True)
+        first.extend([move for _, move in quiet])
+        return first
+
+    def negamax(self, depth: int, alpha: float, beta: float, color: PieceColor, ply: int = 0) -> float:
+        """Negamax search with alpha-beta pruning and a transposition table.
 
-    def minimax(self, depth: int, alpha: float, beta: float, maximizing: bool) -> float:
-        """Minimax algorithm with alpha-beta pruning."""
+        Scores are from the perspective of color, the side to move. ply counts
+        half-moves from the root and indexes the killer moves.
+        """
         if depth == 0:
-            return self.evaluate_position()
-            
-        if maximizing:
-            max_eval = float('-inf')
-            for from_pos, to_pos in self.get_all_valid_moves(PieceColor.WHITE):
-                piece = self.squares[from_pos.row][from_pos.col]
-                captured = self.squares[to_pos.row][to_pos.col]
-                self.squares[to_pos.row][to_pos.col] = piece
-                self.squares[from_pos.row][from_pos.col] = None
-                
-                eval = self.minimax(depth - 1, alpha, beta, False)
-                
-                self.squares[from_pos.row][from_pos.col] = piece
-                self.squares[to_pos.row][to_pos.col] = captured
-                
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
+            return self.quiescence(alpha, beta, color)
+
+        # Probe the transposition table
+        key = self.zobrist ^ ZOBRIST_SIDE if color else self.zobrist
+        if self.en_passant_sq is not None:
+            key ^= ZOBRIST_EP_FILE[self.en_passant_sq & 7]
+        tt = self._tt
+        slot = key & (TT_SIZE - 2)
+        entry = tt[slot]
+        if entry is None or entry[0] != key:
+            entry = tt[slot + 1]
+        tt_move = None
+        if entry is not None and entry[0] == key:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                value, bound = entry[2], entry[3]
+                if bound == TT_EXACT:
+                    return value
+                if bound == TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
                 if beta <= alpha:
-                    break
-            return max_eval
+                    return value
+        bb = self.bb
+
+        # Null-move pruning: if passing still fails high, a real move will too.
+        # Skipped in check and with only pawns left, where passing may be the best option.
+        if (depth >= 3 and self.occ_by_color[color] & ~(bb[PAWN * 2 + color] | bb[KING * 2 + color])
+                and not self.is_king_in_check(color)):
+            en_passant_sq = self.en_passant_sq
+            self.en_passant_sq = None
+            score = -self.negamax(depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, color ^ 1, ply + 1)
+            self.en_passant_sq = en_passant_sq
+            if score >= beta:
+                return score
+
+        alpha_orig = alpha
+        best_move = None
+        killers = self._killers[ply] if ply < MAX_PLY else [None, None]
+        moves = self._order_moves(self.get_all_valid_moves(color), tt_move, killers)
+
+        # Futility pruning: one ply from the leaves, a move whose capture plus
+        # FUTILITY_MARGIN cannot reach the window is not worth searching
+        mailbox = self.mailbox
+        static_eval = None
+        if depth == 1 and not self.is_king_in_check(color):
+            static_eval = -self.evaluate_position() if color else self.evaluate_position()
+
+        value = float('-inf')
+        for from_sq, to_sq in moves:
+            if static_eval is not None:
+                victim = mailbox[to_sq]
+                optimistic = (static_eval + FUTILITY_MARGIN
+                              + (CAPTURE_VALUES[(victim >> 2) & 7] if victim else 0))
+                if optimistic <= alpha:
+                    value = max(value, optimistic)
+                    continue
+            undo = self.make_move(from_sq, to_sq)
+            
+            score = -self.negamax(depth - 1, -beta, -alpha, color ^ 1, ply + 1)
+            
+            self.unmake_move(undo)
+            
+            if score > value:
+                value = score
+                best_move = (from_sq, to_sq)
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                if not mailbox[to_sq]:
+                    self._history[(mailbox[from_sq] >> 1) & 15][to_sq] += depth * depth
+                    if killers[0] != (from_sq, to_sq):
+                        killers[1] = killers[0]
+                        killers[0] = (from_sq, to_sq)
+                break
+
+        # Store the result over a shallower entry, or else in the always-replace slot
+        if value <= alpha_orig:
+            bound = TT_UPPER
+        elif value >= beta:
+            bound = TT_LOWER
         else:
-            min_eval = float('inf')
-            for from_pos, to_pos in self.get_all_valid_moves(PieceColor.BLACK):
-                piece = self.squares[from_pos.row][from_pos.col]
-                captured = self.squares[to_pos.row][to_pos.col]
-                self.squares[to_pos.row][to_pos.col] = piece
-                self.squares[from_pos.row][from_pos.col] = None
-                
-                eval = self.minimax(depth - 1, alpha, beta, True)
-                
-                self.squares[from_pos.row][from_pos.col] = piece
-                self.squares[to_pos.row][to_pos.col] = captured
-                
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-            return min_eval
+            bound = TT_EXACT
+        deepest = tt[slot]
+        if deepest is None or deepest[0] == key or deepest[1] <= depth:
+            tt[slot] = (key, depth, value, bound, best_move)
+        else:
+            tt[slot + 1] = (key, depth, value, bound, best_move)
+        return value
+
+    def quiescence(self, alpha: float, beta: float, color: PieceColor) -> float:
+        """Search captures only until the position is quiet, so leaves are not scored mid-exchange.
+
+        The side to move may also stand pat on the static evaluation instead
+        of capturing, and captures too small to reach alpha are skipped.
+        Scores are from color's perspective, as in negamax.
+        """
+        stand_pat = -self.evaluate_position() if color else self.evaluate_position()
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        mailbox = self.mailbox
+        captures = [move for move in self.get_all_valid_moves(color) if mailbox[move[1]]]
+        best = stand_pat
+        for from_sq, to_sq in self._order_moves(captures, None):
+            optimistic = stand_pat + CAPTURE_VALUES[(mailbox[to_sq] >> 2) & 7] + DELTA_MARGIN
+            if optimistic <= alpha:
+                best = max(best, optimistic)
+                continue
+            undo = self.make_move(from_sq, to_sq)
+            score = -self.quiescence(-beta, -alpha, color ^ 1)
+            self.unmake_move(undo)
+
+            if score > best:
+                best = score
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                break
+        return best
 
     def is_king_in_check(self, color: PieceColor) -> bool:
         """Check if the king of given color is in check."""
-        # Find king position
-        king_pos = None
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if (piece and piece.piece_type == PieceType.KING 
-                    and piece.color == color):
-                    king_pos = Position(row, col)
-                    break
-            if king_pos:
-                break
-        
-        if not king_pos:
-            return False  # Should never happen in a valid game
-        
-        # Check if any opponent piece can capture the king
-        opponent_color = (PieceColor.BLACK if color == PieceColor.WHITE 
-                         else PieceColor.WHITE)
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if piece and piece.color == opponent_color:
-                    if king_pos in piece.get_valid_moves(self):
-                        return True
+        # Check depends only on piece placement, so the Zobrist hash is a full key
+        key = self.zobrist * 2 + color
+        slot = (self.zobrist ^ color) & (MOVE_CACHE_SIZE - 1)
+        entry = self._check_cache[slot]
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        king_bit = self.bb[KING * 2 + color]
+        in_check = bool(king_bit) and self.square_attacked_by(king_bit.bit_length() - 1, color ^ 1)
+        self._check_cache[slot] = (key, in_check)
+        return in_check
+
+    def attackers_to(self, sq: int, by_color: PieceColor) -> int:
+        """Return a bitboard of the pieces of by_color that attack sq."""
+        bb = self.bb
+        occ = self.occ
+        queens = bb[QUEEN * 2 + by_color]
+        pawn_sources = PAWN_ATTACKS_BLACK[sq] if by_color == WHITE else PAWN_ATTACKS_WHITE[sq]
+        return ((KNIGHT_ATTACKS[sq] & bb[KNIGHT * 2 + by_color])
+                | (pawn_sources & bb[PAWN * 2 + by_color])
+                | (KING_ATTACKS[sq] & bb[KING * 2 + by_color])
+                | (ROOK_TABLES[sq][occ & ROOK_MASKS[sq]] & (bb[ROOK * 2 + by_color] | queens))
+                | (BISHOP_TABLES[sq][occ & BISHOP_MASKS[sq]] & (bb[BISHOP * 2 + by_color] | queens)))
+
+    def pinned_pieces(self, color: PieceColor, king_sq: int) -> Dict[int, int]:
+        """Map each piece of color pinned to its king to the squares it may still move to.
+
+        A pinned piece may only move between the king and the pinner or capture it.
+        """
+        bb = self.bb
+        occ = self.occ
+        opponent = color ^ 1
+        queens = bb[QUEEN * 2 + opponent]
+        # Rays from the king on an empty board; sliders on them are pin candidates
+        candidates = ((ROOK_TABLES[king_sq][0] & (bb[ROOK * 2 + opponent] | queens))
+                      | (BISHOP_TABLES[king_sq][0] & (bb[BISHOP * 2 + opponent] | queens)))
+        pins = {}
+        own = self.occ_by_color[color]
+        for pinner in bits_to_squares(candidates):
+            blockers = BETWEEN[king_sq][pinner] & occ
+            # Exactly one blocker, and it is ours
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pins[blockers.bit_length() - 1] = BETWEEN[king_sq][pinner] | (1 << pinner)
+        return pins
+
+    def iter_legal_moves(self, color: PieceColor) -> Iterator[Tuple[int, int]]:
+        """Yield the moves of color that do not leave its king in check.
+
+        Pins and checkers are computed once, so most moves are accepted or
+        rejected with mask tests; only king moves and en passant captures are
+        played out on the board.
+        """
+        king_bit = self.bb[KING * 2 + color]
+        king_sq = king_bit.bit_length() - 1
+        checkers = self.attackers_to(king_sq, color ^ 1)
+        if checkers & (checkers - 1):
+            targets = 0  # Double check, only the king can move
+        elif checkers:
+            # Block the check or capture the checking piece
+            targets = BETWEEN[king_sq][checkers.bit_length() - 1] | checkers
+        else:
+            targets = FULL_BOARD
+        pins = self.pinned_pieces(color, king_sq)
+        mailbox = self.mailbox
+
+        for from_sq, to_sq in self.get_all_valid_moves(color):
+            piece_type = (mailbox[from_sq] >> 2) & 7
+            en_passant = (piece_type == PAWN and (from_sq ^ to_sq) & 7
+                          and not mailbox[to_sq])
+            if piece_type != KING and not en_passant:
+                to_bit = 1 << to_sq
+                if to_bit & targets and to_bit & pins.get(from_sq, FULL_BOARD):
+                    yield from_sq, to_sq
+                continue
+
+            # Play out the move and see whether the king is still attacked
+            undo = self.make_move(from_sq, to_sq)
+            in_check = self.is_king_in_check(color)
+            self.unmake_move(undo)
+            if not in_check:
+                yield from_sq, to_sq
+
+    def get_legal_moves(self, color: PieceColor) -> List[Tuple[int, int]]:
+        """Get all moves for color that do not leave its king in check."""
+        return list(self.iter_legal_moves(color))
+
+    def has_legal_move(self, color: PieceColor) -> bool:
+        """Return True if color has at least one move that does not leave its king in check."""
+        for _ in self.iter_legal_moves(color):
+            return True
         return False
 
+    def square_attacked_by(self, sq: int, by_color: PieceColor) -> bool:
+        """Return True if any piece of by_color attacks sq.
+
+        Works backwards from the target: each piece type's attack pattern is
+        cast from sq and tested against the attacker's bitboard for that type.
+        """
+        bb = self.bb
+        if KNIGHT_ATTACKS[sq] & bb[KNIGHT * 2 + by_color]:
+            return True
+        # A pawn attacks sq from the squares a pawn of the other color would attack
+        pawn_sources = PAWN_ATTACKS_BLACK[sq] if by_color == WHITE else PAWN_ATTACKS_WHITE[sq]
+        if pawn_sources & bb[PAWN * 2 + by_color]:
+            return True
+        if KING_ATTACKS[sq] & bb[KING * 2 + by_color]:
+            return True
+        occ = self.occ
+        queens = bb[QUEEN * 2 + by_color]
+        if ROOK_TABLES[sq][occ & ROOK_MASKS[sq]] & (bb[ROOK * 2 + by_color] | queens):
+            return True
+        return bool(BISHOP_TABLES[sq][occ & BISHOP_MASKS[sq]] & (bb[BISHOP * 2 + by_color] | queens))
+
+    def game_status(self, color: PieceColor) -> GameStatus:
+        """Return whether color, to move, is checkmated, stalemated or still playing.
+
+        One legal move search answers both, and it stops at the first legal move.
+        """
+        if self.has_legal_move(color):
+            return GameStatus.ONGOING
+        return GameStatus.CHECKMATE if self.is_king_in_check(color) else GameStatus.STALEMATE
+
+    def san(self, from_sq: int, to_sq: int) -> str:
+        """Return a legal move in standard algebraic notation, before it is played.
+
+        The game has no promotion, so a pawn move to the last rank gets no =Q
+        suffix and is not valid SAN; self_play stops before recording one.
+        """
+        code = self.mailbox[from_sq]
+        piece_type = (code >> 2) & 7
+        color = (code >> 1) & 1
+        capture = "x" if self.mailbox[to_sq] or (piece_type == PAWN and (from_sq ^ to_sq) & 7) else ""
+        if piece_type == PAWN:
+            san = (SQUARE_NAMES[from_sq][0] + capture if capture else "") + SQUARE_NAMES[to_sq]
+        else:
+            # Name the file, rank or both when another such piece can reach to_sq
+            others = [sq for sq, target in self.iter_legal_moves(color)
+                      if target == to_sq and sq != from_sq and (self.mailbox[sq] >> 2) & 7 == piece_type]
+            name = SQUARE_NAMES[from_sq]
+            if not others:
+                prefix = ""
+            elif all(sq & 7 != from_sq & 7 for sq in others):
+                prefix = name[0]
+            elif all(sq >> 3 != from_sq >> 3 for sq in others):
+                prefix = name[1]
+            else:
+                prefix = name
+            san = PIECE_TYPES[piece_type].symbol + prefix + capture + SQUARE_NAMES[to_sq]
+
+        undo = self.make_move(from_sq, to_sq)
+        if self.is_king_in_check(color ^ 1):
+            san += "+" if self.has_legal_move(color ^ 1) else "#"
+        self.unmake_move(undo)
+        return san
+
     def is_checkmate(self, color: PieceColor) -> bool:
         """Check if the given color is in checkmate."""
         if not self.is_king_in_check(color):
             return False
             
-        # Try all possible moves for all pieces
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if piece and piece.color == color:
-                    from_pos = Position(row, col)
-                    for to_pos in piece.get_valid_moves(self):
-                        # Try the move
-                        captured_piece = self.squares[to_pos.row][to_pos.col]
-                        self.squares[to_pos.row][to_pos.col] = piece
-                        self.squares[from_pos.row][from_pos.col] = None
-                        
-                        # Check if still in check
-                        still_in_check = self.is_king_in_check(color)
-                        
-                        # Undo the move
-                        self.squares[from_pos.row][from_pos.col] = piece
-                        self.squares[to_pos.row][to_pos.col] = captured_piece
-                        
-                        if not still_in_check:
-                            return False  # Found a legal move
-        
-        return True  # No legal moves found
+        return not self.has_legal_move(color)
 
     def is_stalemate(self, color: PieceColor) -> bool:
         """Check if the given color is in stalemate."""
         if self.is_king_in_check(color):
             return False
             
-        # Check if any piece has valid moves
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if piece and piece.color == color:
-                    from_pos = Position(row, col)
-                    for to_pos in piece.get_valid_moves(self):
-                        # Try the move
-                        captured_piece = self.squares[to_pos.row][to_pos.col]
-                        self.squares[to_pos.row][to_pos.col] = piece
-                        self.squares[from_pos.row][from_pos.col] = None
-                        
-                        # Check if move puts king in check
-                        in_check = self.is_king_in_check(color)
-                        
-                        # Undo the move
-                        self.squares[from_pos.row][from_pos.col] = piece
-                        self.squares[to_pos.row][to_pos.col] = captured_piece
-                        
-                        if not in_check:
-                            return False  # Found a legal move
-        
-        return True  # No legal moves found
+        return not self.has_legal_move(color)
 
     def display(self):
-        # Clear screen before drawing
-        clear_screen()
-        
-        print("\n   a b c d e f g h")
-        print("   ---------------")
-        for row in range(8):
-            print(f"{8 - row} |", end=" ")
-            for col in range(8):
-                piece = self.squares[row][col]
-                bg_color = Back.WHITE if (row + col) % 2 == 0 else Back.BLACK
-                if piece:
-                    print(f"{bg_color}{piece}{Style.RESET_ALL}", end=" ")
-                else:
-                    print(f"{bg_color} {Style.RESET_ALL}", end=" ")
-            print(f"| {8 - row}")
-        print("   ---------------")
-        print("   a b c d e f g h")
+        # Reuse the last frame if no piece has moved since it was built
+        if self._frame[0] != self.zobrist:
+            cells = [CELL_GLYPHS[sq][(code >> 1) & 15] if code else CELL_GLYPHS[sq][12]
+                     for sq, code in enumerate(self.mailbox)]
+            self._frame = (self.zobrist, FRAME_TEMPLATE.format(*cells))
+        sys.stdout.write(self._frame[1])
+        sys.stdout.flush()
 
     def evaluate_position(self) -> float:
         """Evaluate the current board position from white's perspective."""
-        score = 0.0
-        
-        # Piece values and positions
-        for row in range(8):
-            for col in range(8):
-                piece = self.squares[row][col]
-                if not piece:
-                    continue
-                    
-                piece_value = piece.piece_type.value_score
-                position_bonus = self._get_position_bonus(piece, row, col)
-                
-                if piece.color == PieceColor.WHITE:
-                    score += piece_value + position_bonus
-                else:
-                    score -= piece_value + position_bonus
-                    
-        return score
-
-    def _get_position_bonus(self, piece: Piece, row: int, col: int) -> float:
-        """Calculate position bonus based on piece type and position."""
-        bonus = 0.0
-        
-        # Pawns are more valuable as they advance
-        if piece.piece_type == PieceType.PAWN:
-            if piece.color == PieceColor.WHITE:
-                bonus = (7 - row) * 0.1  # Bonus for advancing
-            else:
-                bonus = row * 0.1
-        
-        # Control of center squares
-        if 2 <= row <= 5 and 2 <= col <= 5:
-            bonus += 0.2
-            
-        # Knights are better near the center
-        if piece.piece_type == PieceType.KNIGHT:
-            distance_from_center = abs(3.5 - row) + abs(3.5 - col)
-            bonus += (8 - distance_from_center) * 0.1
-            
-        return bonus
+        # Piece values and positions are kept up to date by _toggle_bit
+        return self.eval_cp / 100
 
     def play_computer_vs_computer(self, max_moves: int = 50, delay: float = 1.0):
         """Simulate a game between two computer players."""
-        import time
-        
         move_count = 0
         while move_count < max_moves:
             self.display()
             time.sleep(delay)
             
             # Check for game end conditions
-            if self.is_checkmate(self.current_player):
-                winner = "Black" if self.current_player == PieceColor.WHITE else "White"
+            status = self.game_status(self.current_player)
+            if status == GameStatus.CHECKMATE:
+                winner = "Black" if self.current_player == WHITE else "White"
                 print(f"\nCheckmate! {winner} wins!")
                 break
-            elif self.is_stalemate(self.current_player):
+            elif status == GameStatus.STALEMATE:
                 print("\nStalemate! Game is a draw.")
                 break
                 
             # Make computer move
             if not self.make_computer_move(self.current_player):
-                print(f"\nNo valid moves for {self.current_player.value}. Game over!")
+                print(f"\nNo valid moves for {self.current_player.name.lower()}. Game over!")
                 break
                 
             move_count += 1
@@ -654,9 +1075,55 @@ class Board:
             
         self.display()  # Show final position
 
+# Opening lines the computer plays without searching, main lines first
+BOOK_LINES = (
+    "e2 e4 e7 e5 g1 f3 b8 c6 f1 b5 a7 a6 b5 a4 g8 f6",
+    "e2 e4 e7 e5 g1 f3 b8 c6 f1 c4 f8 c5 c2 c3 g8 f6",
+    "e2 e4 c7 c5 g1 f3 d7 d6 d2 d4 c5 d4 f3 d4 g8 f6 b1 c3",
+    "e2 e4 e7 e6 d2 d4 d7 d5 b1 c3 g8 f6",
+    "e2 e4 c7 c6 d2 d4 d7 d5 b1 c3 d5 e4 c3 e4",
+    "d2 d4 d7 d5 c2 c4 e7 e6 b1 c3 g8 f6 c1 g5",
+    "d2 d4 g8 f6 c2 c4 e7 e6 b1 c3 f8 b4",
+    "c2 c4 e7 e5 b1 c3 g8 f6 g1 f3 b8 c6",
+    "g1 f3 d7 d5 d2 d4 g8 f6 c2 c4",
+)
+
+def _play_book_line(board: Board, line: str) -> List[Tuple[int, Tuple[int, int]]]:
+    """Play a BOOK_LINES entry on board and return (position_key, move) before each move.
+
+    Raises ValueError naming the line and move if a move is rejected.
+    """
+    played = []
+    names = line.split()
+    for from_name, to_name in zip(names[::2], names[1::2]):
+        move = parse_move(f"{from_name} {to_name}")
+        played.append((board.position_key(board.current_player), move))
+        success, error = board.move_piece(*move)
+        if not success:
+            raise ValueError(f"Book line {line!r}: {from_name} {to_name} is rejected: {error}")
+    return played
+
+def _build_opening_book() -> Dict[int, List[Tuple[int, int]]]:
+    """Replay BOOK_LINES and map each position's key to the book moves played from it."""
+    book = {}
+    for line in BOOK_LINES:
+        for key, move in _play_book_line(Board(), line):
+            moves = book.setdefault(key, [])
+            if move not in moves:
+                moves.append(move)
+    return book
+
+OPENING_BOOK = _build_opening_book()
+
 class Game:
-    def __init__(self):
+    def __init__(self, interactive: bool = True):
         self.board = Board()
+        self.interactive = interactive  # False skips the "Press Enter" pauses for scripted play
+
+    def pause(self, prompt: str):
+        """Wait for Enter in interactive mode."""
+        if self.interactive:
+            input(prompt)
 
     def show_menu(self) -> str:
         """Display game mode menu and return selected mode."""
@@ -701,7 +1168,7 @@ class Game:
             if mode == "computer":
                 print("\nComputer vs Computer match")
                 print("Press Ctrl+C to stop the game")
-                input("Press Enter to start...")
+                self.pause("Press Enter to start...")
                 self.board = Board()  # Reset board
                 self.board.play_computer_vs_computer()
             elif mode in ["white", "black"]:
@@ -709,14 +1176,14 @@ class Game:
                 print(f"\nPlaying as {'White' if mode == 'white' else 'Black'}")
                 print("Enter moves in algebraic notation (e.g., 'e2 e4')")
                 print("Type 'quit' to return to menu")
-                input("Press Enter to start...")
+                self.pause("Press Enter to start...")
                 self.board = Board()  # Reset board
                 self.play_vs_computer(computer_color)
             else:  # human vs human
                 print("\nPlayer vs Player match")
                 print("Enter moves in algebraic notation (e.g., 'e2 e4')")
                 print("Type 'quit' to return to menu")
-                input("Press Enter to start...")
+                self.pause("Press Enter to start...")
                 self.board = Board()  # Reset board
                 self.play_human()
 
@@ -726,35 +1193,32 @@ class Game:
             self.board.display()
             
             try:
-                move = input(f"\n{self.board.current_player.value}'s move (e.g., e2 e4): ").strip().lower()
+                move = input(f"\n{self.board.current_player.name.lower()}'s move (e.g., e2 e4): ").strip().lower()
                 if move == "quit":
                     break
                     
-                from_sq, to_sq = move.split()
-                from_pos = Position(8 - int(from_sq[1]), ord(from_sq[0]) - ord('a'))
-                to_pos = Position(8 - int(to_sq[1]), ord(to_sq[0]) - ord('a'))
-                
-                success, error = self.board.move_piece(from_pos, to_pos)
+                success, error = self.board.move_piece(*parse_move(move))
                 if not success:
                     print(f"Invalid move: {error}")
-                    input("Press Enter to continue...")
+                    self.pause("Press Enter to continue...")
                     continue
                     
-                if self.board.is_checkmate(self.board.current_player):
+                status = self.board.game_status(self.board.current_player)
+                if status == GameStatus.CHECKMATE:
                     self.board.display()
                     winner = "Black" if self.board.current_player == PieceColor.WHITE else "White"
                     print(f"\nCheckmate! {winner} wins!")
-                    input("\nPress Enter to return to menu...")
+                    self.pause("\nPress Enter to return to menu...")
                     break
-                elif self.board.is_stalemate(self.board.current_player):
+                elif status == GameStatus.STALEMATE:
                     self.board.display()
                     print("\nStalemate! Game is a draw.")
-                    input("\nPress Enter to return to menu...")
+                    self.pause("\nPress Enter to return to menu...")
                     break
                     
-            except (ValueError, IndexError):
+            except ValueError:
                 print("Invalid input format. Use 'e2 e4' format or 'quit' to return to menu.")
-                input("Press Enter to continue...")
+                self.pause("Press Enter to continue...")
 
     def play_vs_computer(self, computer_color: PieceColor):
         """Human vs Computer game mode."""
@@ -765,7 +1229,7 @@ class Game:
                 print("\nComputer is thinking...")
                 if not self.board.make_computer_move(computer_color):
                     print("\nNo valid moves for computer. Game over!")
-                    input("\nPress Enter to return to menu...")
+                    self.pause("\nPress Enter to return to menu...")
                     break
             else:
                 try:
@@ -773,33 +1237,128 @@ class Game:
                     if move == "quit":
                         break
                         
-                    from_sq, to_sq = move.split()
-                    from_pos = Position(8 - int(from_sq[1]), ord(from_sq[0]) - ord('a'))
-                    to_pos = Position(8 - int(to_sq[1]), ord(to_sq[0]) - ord('a'))
-                    
-                    success, error = self.board.move_piece(from_pos, to_pos)
+                    success, error = self.board.move_piece(*parse_move(move))
                     if not success:
                         print(f"Invalid move: {error}")
-                        input("Press Enter to continue...")
+                        self.pause("Press Enter to continue...")
                         continue
                         
-                except (ValueError, IndexError):
+                except ValueError:
                     print("Invalid input format. Use 'e2 e4' format or 'quit' to return to menu.")
-                    input("Press Enter to continue...")
+                    self.pause("Press Enter to continue...")
                     continue
                     
-            if self.board.is_checkmate(self.board.current_player):
+            status = self.board.game_status(self.board.current_player)
+            if status == GameStatus.CHECKMATE:
                 self.board.display()
                 winner = "Black" if self.board.current_player == PieceColor.WHITE else "White"
                 print(f"\nCheckmate! {winner} wins!")
-                input("\nPress Enter to return to menu...")
+                self.pause("\nPress Enter to return to menu...")
                 break
-            elif self.board.is_stalemate(self.board.current_player):
+            elif status == GameStatus.STALEMATE:
                 self.board.display()
                 print("\nStalemate! Game is a draw.")
-                input("\nPress Enter to return to menu...")
+                self.pause("\nPress Enter to return to menu...")
                 break
 
+    def self_play(self, games: int, depth: int = 3, max_moves: int = 200, random_plies: int = 2):
+        """Play computer vs computer games without pauses and print each as PGN.
+
+        Game n starts from BOOK_LINES[n % len(BOOK_LINES)]. Once every line has
+        been used, random_plies random legal moves, seeded by n, follow the
+        book line so later games do not repeat earlier ones. Runs are reproducible.
+        """
+        for game_index in range(games):
+            self.board = board = Board()
+            _play_book_line(board, BOOK_LINES[game_index % len(BOOK_LINES)])
+            if game_index >= len(BOOK_LINES):
+                rng = random.Random(game_index)
+                for _ in range(random_plies):
+                    moves = board.get_legal_moves(board.current_player)
+                    if not moves:
+                        break
+                    board.move_piece(*rng.choice(moves))
+
+            # Count positions so a threefold repetition ends the game as a draw
+            seen = {board.position_key(board.current_player): 1}
+            repeated = False
+            comment = None
+            history = board.move_history
+            status = board.game_status(board.current_player)
+            while status == GameStatus.ONGOING and len(board.move_history) < max_moves:
+                if not board.make_computer_move(board.current_player, depth):
+                    break
+                from_sq, to_sq, piece_type, _ = board.move_history[-1]
+                if piece_type == PAWN and to_sq >> 3 in (0, 7):
+                    # Promotion is not supported, so the move cannot be written as PGN
+                    history = board.move_history[:-1]
+                    comment = (f"{SQUARE_NAMES[from_sq]}-{SQUARE_NAMES[to_sq]} would promote,"
+                               " which this game does not support")
+                    break
+                key = board.position_key(board.current_player)
+                seen[key] = seen.get(key, 0) + 1
+                if seen[key] == 3:
+                    repeated = True
+                    break
+                status = board.game_status(board.current_player)
+
+            if comment is not None:
+                result = "*"
+            elif status == GameStatus.CHECKMATE:
+                result = "0-1" if board.current_player == WHITE else "1-0"
+            elif status == GameStatus.STALEMATE or repeated:
+                result = "1/2-1/2"
+            else:
+                result = "*"
+            print(self.pgn(game_index + 1, result, history, comment))
+            sys.stdout.flush()
+
+    def pgn(self, round_number: int, result: str,
+            history: Optional[List[Tuple[int, int, PieceType, PieceColor]]] = None,
+            comment: Optional[str] = None) -> str:
+        """Format a game as PGN: history defaults to the current board's moves,
+        and comment is added after the last move."""
+        if history is None:
+            history = self.board.move_history
+        replay = Board()
+        movetext = []
+        for from_sq, to_sq, _, color in history:
+            if color == WHITE:
+                movetext.append(f"{len(replay.move_history) // 2 + 1}.")
+            movetext.append(replay.san(from_sq, to_sq))
+            replay.move_piece(from_sq, to_sq)
+        if comment is not None:
+            movetext.append("{" + comment + "}")
+        movetext.append(result)
+        return "\n".join((
+            '[Event "CLI Chess self-play"]',
+            '[Site "?"]',
+            '[Date "????.??.??"]',
+            f'[Round "{round_number}"]',
+            '[White "Computer"]',
+            '[Black "Computer"]',
+            f'[Result "{result}"]',
+            "",
+            textwrap.fill(" ".join(movetext), width=79),
+            "",
+        ))
+
 if __name__ == "__main__":
-    game = Game()
-    game.play()
+    parser = argparse.ArgumentParser(description="Play chess in the terminal.")
+    parser.add_argument("--self-play", type=int, metavar="N",
+                        help="play N computer vs computer games and print them as PGN")
+    parser.add_argument("--depth", type=int, metavar="D",
+                        help="search depth for --self-play (default: 3)")
+    args = parser.parse_args()
+    if args.self_play is not None and args.self_play < 1:
+        parser.error("--self-play N must be at least 1")
+    if args.depth is not None:
+        if args.self_play is None:
+            parser.error("--depth only applies with --self-play")
+        if args.depth < 1:
+            parser.error("--depth D must be at least 1")
+    if args.self_play is not None:
+        Game(interactive=False).self_play(args.self_play, 3 if args.depth is None else args.depth)
+    else:
+        game = Game()
+        game.play()